@@ -1,44 +1,93 @@
 """
 Application configuration module.
 """
+import logging
 import os
-from typing import Optional
+from functools import cached_property, lru_cache
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+def _parse_bool(name: str, default: bool = False) -> bool:
+    """Read a boolean flag from the environment."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.lower() in _TRUTHY
 
 
 class Settings:
     """Application settings and configuration."""
-    
+
     # Application settings
-    APP_NAME: str = "FastAPI CI/CD Demo"
-    APP_VERSION: str = "1.0.0"
-    DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
-    
+    APP_NAME: str
+    APP_VERSION: str
+    DEBUG: bool
+
     # Environment settings
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
-    
+    ENVIRONMENT: str
+
     # Server settings
-    HOST: str = os.getenv("HOST", "0.0.0.0")
-    PORT: int = int(os.getenv("PORT", "8000"))
-    
+    HOST: str
+    PORT: int
+
     # Logging settings
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
-    
+    LOG_LEVEL: str
+    LOG_LEVEL_INT: int
+    LOG_LEVEL_LOWER: str
+
     # CORS settings
-    CORS_ORIGINS: list = ["*"] if ENVIRONMENT == "development" else []
-    
+    CORS_ORIGINS: list
+
     # Health check settings
-    HEALTH_CHECK_TIMEOUT: int = int(os.getenv("HEALTH_CHECK_TIMEOUT", "30"))
-    
-    @property
+    HEALTH_CHECK_TIMEOUT: int
+
+    def __init__(self) -> None:
+        """Read settings from the process environment."""
+        env = os.environ
+
+        self.APP_NAME = "FastAPI CI/CD Demo"
+        self.APP_VERSION = "1.0.0"
+        self.DEBUG = _parse_bool("DEBUG")
+
+        self.ENVIRONMENT = env.get("ENVIRONMENT", "development")
+
+        self.HOST = env.get("HOST", "0.0.0.0")
+        self.PORT = int(env.get("PORT", "8000"))
+
+        self.LOG_LEVEL = env.get("LOG_LEVEL", "INFO")
+        self.LOG_LEVEL_INT = logging.getLevelNamesMapping().get(
+            self.LOG_LEVEL.upper(), logging.INFO
+        )
+        # Derived from the resolved level so aliases and unknown names still
+        # give a level name uvicorn accepts
+        self.LOG_LEVEL_LOWER = logging.getLevelName(self.LOG_LEVEL_INT).lower()
+
+        self.CORS_ORIGINS = ["*"] if self.ENVIRONMENT == "development" else []
+
+        self.HEALTH_CHECK_TIMEOUT = int(env.get("HEALTH_CHECK_TIMEOUT", "30"))
+
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production environment."""
         return self.ENVIRONMENT == "production"
-    
-    @property
+
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development environment."""
         return self.ENVIRONMENT == "development"
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide settings instance.
+
+    The environment is read once; call ``get_settings.cache_clear()``
+    to pick up environment changes (e.g. in tests).
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
@@ -0,0 +1,52 @@
+"""
+CORS middleware with memoized preflight responses.
+"""
+import copy
+from functools import lru_cache
+from typing import Any, Optional
+
+from starlette.datastructures import Headers
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import Response
+
+PREFLIGHT_CACHE_SIZE = 64
+
+
+class CachedCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware that reuses preflight responses.
+
+    A preflight response depends only on the middleware configuration and
+    the request's origin, requested method and requested headers, so it is
+    built once per distinct combination and copied for later requests.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._cached_preflight = lru_cache(maxsize=PREFLIGHT_CACHE_SIZE)(
+            self._build_preflight
+        )
+
+    def _build_preflight(
+        self, origin: str, method: str, requested_headers: Optional[str]
+    ) -> Response:
+        raw = [
+            (b"origin", origin.encode("latin-1")),
+            (b"access-control-request-method", method.encode("latin-1")),
+        ]
+        if requested_headers is not None:
+            raw.append(
+                (b"access-control-request-headers", requested_headers.encode("latin-1"))
+            )
+        return super().preflight_response(request_headers=Headers(raw=raw))
+
+    def preflight_response(self, request_headers: Headers) -> Response:
+        cached = self._cached_preflight(
+            request_headers["origin"],
+            request_headers["access-control-request-method"],
+            request_headers.get("access-control-request-headers"),
+        )
+        # Copy so nothing downstream can mutate the cached header list
+        response = copy.copy(cached)
+        response.raw_headers = list(cached.raw_headers)
+        return response
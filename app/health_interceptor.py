@@ -0,0 +1,146 @@
+"""
+ASGI health check interceptor.
+
+Answers load balancer and orchestrator probes before the request reaches
+the FastAPI application, so probe traffic skips middleware, routing and
+response model validation.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+HealthCheck = Callable[[], Awaitable[Any]]
+ResponseMessages = Tuple[Dict[str, Any], Dict[str, Any]]
+
+logger = logging.getLogger(__name__)
+
+HEALTH_PATHS = frozenset({"/health", "/healthz", "/readyz"})
+
+HEALTHY_BODY = b'{"status":"healthy"}'
+UNHEALTHY_BODY = b'{"status":"unhealthy"}'
+METHOD_NOT_ALLOWED_BODY = b'{"detail":"Method Not Allowed"}'
+
+# The first probe waits for the checks, so a refresh must finish well inside
+# the 5s load balancer and container probe timeouts
+MAX_REFRESH_TIMEOUT = 3.0
+
+
+def _json_messages(
+    status: int, body: bytes, extra_headers: Iterable[Tuple[bytes, bytes]] = ()
+) -> ResponseMessages:
+    """Build the start and body ASGI messages for a fixed JSON response."""
+    start = {
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            *extra_headers,
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    }
+    return start, {"type": "http.response.body", "body": body}
+
+
+# Pre-built ASGI messages, sent as-is on every probe
+RESPONSE_START, RESPONSE_BODY = _json_messages(200, HEALTHY_BODY)
+UNHEALTHY_START, UNHEALTHY_RESPONSE_BODY = _json_messages(503, UNHEALTHY_BODY)
+METHOD_NOT_ALLOWED_START, METHOD_NOT_ALLOWED_RESPONSE_BODY = _json_messages(
+    405, METHOD_NOT_ALLOWED_BODY, [(b"allow", b"GET")]
+)
+
+
+class HealthCache:
+    """
+    Stale-while-revalidate cache of the aggregated health status.
+
+    Probes are answered from the last known result. Once it is older than
+    ``ttl`` seconds, a single background refresh re-runs the checks while
+    probes keep receiving the stale result. Only the very first probe
+    waits for the checks, so ``timeout`` must stay below the load balancer
+    and container probe timeouts (see ``MAX_REFRESH_TIMEOUT``).
+    """
+
+    def __init__(
+        self,
+        checks: Sequence[HealthCheck] = (),
+        ttl: float = 5.0,
+        timeout: float = MAX_REFRESH_TIMEOUT,
+    ) -> None:
+        self.checks = list(checks)
+        self.ttl = ttl
+        self.timeout = timeout
+        self.response: Optional[ResponseMessages] = None
+        self.deadline = 0.0
+        self.lock = asyncio.Lock()
+        self._refresh_task: Optional["asyncio.Task[ResponseMessages]"] = None
+
+    def add_check(self, check: HealthCheck) -> HealthCheck:
+        """Register a dependency check; usable as a decorator."""
+        self.checks.append(check)
+        return check
+
+    async def refresh(self) -> ResponseMessages:
+        """Run all checks, then store and return the resulting response."""
+        healthy = True
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    *(check() for check in self.checks), return_exceptions=True
+                ),
+                timeout=self.timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.error("Health check timed out after %ss", self.timeout)
+            healthy = False
+        else:
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.error("Health check failed: %r", result)
+                    healthy = False
+
+        if healthy:
+            response = (RESPONSE_START, RESPONSE_BODY)
+        else:
+            response = (UNHEALTHY_START, UNHEALTHY_RESPONSE_BODY)
+        self.response = response
+        self.deadline = time.monotonic() + self.ttl
+        return response
+
+    async def get(self) -> ResponseMessages:
+        """Return the cached response, refreshing it if stale."""
+        response = self.response
+        if response is None:
+            async with self.lock:
+                response = self.response
+                if response is None:
+                    response = await self.refresh()
+            return response
+
+        if time.monotonic() >= self.deadline and (
+            self._refresh_task is None or self._refresh_task.done()
+        ):
+            self._refresh_task = asyncio.create_task(self.refresh())
+        return response
+
+
+class HealthCheckInterceptor:
+    """ASGI wrapper that serves health check paths without calling the app."""
+
+    def __init__(self, app: ASGIApp, cache: Optional[HealthCache] = None) -> None:
+        self.app = app
+        self.cache = cache if cache is not None else HealthCache()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in HEALTH_PATHS:
+            if scope["method"] == "GET":
+                start, body = await self.cache.get()
+            else:
+                start, body = METHOD_NOT_ALLOWED_START, METHOD_NOT_ALLOWED_RESPONSE_BODY
+            await send(start)
+            await send(body)
+            return
+
+        await self.app(scope, receive, send)
@@ -1,20 +1,31 @@
 """
 FastAPI application with health checks and environment configuration.
 """
+import json
 import logging
 from contextlib import asynccontextmanager
-from typing import Dict, Any, AsyncGenerator
+from typing import AsyncGenerator
 
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-import uvicorn
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response
 
-from app.config import settings
+from app.config import get_settings
+from app.cors import CachedCORSMiddleware
+from app.health_interceptor import (
+    MAX_REFRESH_TIMEOUT,
+    HealthCache,
+    HealthCheckInterceptor,
+)
+
+settings = get_settings()
 
-# Configure logging
+# Configure logging. The format has no thread or process fields, so skip
+# collecting them for every record.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logging.basicConfig(
-    level=getattr(logging, settings.LOG_LEVEL.upper()),
+    level=settings.LOG_LEVEL_INT,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
@@ -24,9 +35,9 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan event handler."""
     # Startup
-    logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
-    logger.info(f"Environment: {settings.ENVIRONMENT}")
-    logger.info(f"Debug mode: {settings.DEBUG}")
+    logger.info("Starting %s v%s", settings.APP_NAME, settings.APP_VERSION)
+    logger.info("Environment: %s", settings.ENVIRONMENT)
+    logger.info("Debug mode: %s", settings.DEBUG)
     
     yield
     
@@ -35,74 +46,98 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
 
 # Initialize FastAPI app
-app = FastAPI(
+fastapi_app = FastAPI(
     title=settings.APP_NAME,
     description="A production-ready FastAPI application with CI/CD pipeline",
     version=settings.APP_VERSION,
     debug=settings.DEBUG,
     docs_url="/docs" if not settings.is_production else None,
     redoc_url="/redoc" if not settings.is_production else None,
+    openapi_url="/openapi.json" if not settings.is_production else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
+# Add CORS middleware (health probes are answered before it runs)
+fastapi_app.add_middleware(
+    CachedCORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_methods=["GET"],
     allow_headers=["*"],
 )
 
 
-@app.get("/", response_model=Dict[str, Any])
-async def read_root() -> Dict[str, Any]:
-    """
-    Root endpoint returning application information.
-    
-    Returns:
-        Dict containing application metadata
-    """
-    return {
+# Root payload only depends on settings fixed at startup, so serialize it once
+_ROOT_BYTES = json.dumps(
+    {
         "message": "Hello from FastAPI!",
         "environment": settings.ENVIRONMENT,
         "version": settings.APP_VERSION,
         "status": "running",
         "debug": settings.DEBUG
-    }
-
-
-@app.get("/health", response_model=Dict[str, str])
-async def health_check() -> Dict[str, str]:
+    },
+    separators=(",", ":"),
+).encode("utf-8")
+
+
+# Documents the root payload without a response model, so FastAPI builds no
+# Pydantic field for the route
+_ROOT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "message": {"type": "string"},
+        "environment": {"type": "string"},
+        "version": {"type": "string"},
+        "status": {"type": "string"},
+        "debug": {"type": "boolean"},
+    },
+    "required": ["message", "environment", "version", "status", "debug"],
+}
+
+
+@fastapi_app.get(
+    "/",
+    response_model=None,
+    responses={200: {"content": {"application/json": {"schema": _ROOT_SCHEMA}}}},
+)
+async def read_root() -> Response:
     """
-    Health check endpoint for load balancer and monitoring.
+    Root endpoint returning application information.
     
     Returns:
-        Dict containing health status
+        JSON response containing application metadata
     """
-    try:
-        # Add any health checks here (database, external services, etc.)
-        return {"status": "healthy"}
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        raise HTTPException(status_code=503, detail="Service unavailable")
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
-@app.exception_handler(Exception)
+@fastapi_app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler for unhandled errors."""
-    logger.error(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc)
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"}
     )
 
 
+# Health probes are answered ahead of the FastAPI middleware stack.
+# Register dependency checks (database, external services, etc.) with
+# health_cache.add_check(). HEALTH_CHECK_TIMEOUT is capped so the first
+# probe, which waits for the checks, cannot outlast the probe timeout.
+health_cache = HealthCache(
+    timeout=min(settings.HEALTH_CHECK_TIMEOUT, MAX_REFRESH_TIMEOUT)
+)
+app = HealthCheckInterceptor(fastapi_app, health_cache)
+
+
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.is_development,
-        log_level=settings.LOG_LEVEL.lower()
+        log_level=settings.LOG_LEVEL_LOWER
     )
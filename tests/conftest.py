@@ -0,0 +1,58 @@
+"""
+Shared fixtures for the test suite.
+"""
+from importlib import reload
+from typing import AsyncIterator, Awaitable, Callable
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app import main
+from app.config import get_settings
+
+BASE_URL = "http://test"
+
+
+def _make_client(asgi_app) -> httpx.AsyncClient:
+    """Create an in-process client bound to an ASGI app."""
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=asgi_app), base_url=BASE_URL
+    )
+
+
+@pytest_asyncio.fixture
+async def client() -> AsyncIterator[httpx.AsyncClient]:
+    """Async client for the application."""
+    async with _make_client(main.app) as c:
+        yield c
+
+
+@pytest_asyncio.fixture
+async def env_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncIterator[Callable[..., Awaitable[httpx.AsyncClient]]]:
+    """
+    Factory for clients bound to an app rebuilt under patched environment variables.
+
+    The application module is rebuilt again from the original environment
+    on teardown so later tests are unaffected.
+    """
+    clients = []
+
+    async def factory(**env: str) -> httpx.AsyncClient:
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        get_settings.cache_clear()
+        reload(main)
+        c = _make_client(main.app)
+        clients.append(c)
+        return c
+
+    yield factory
+
+    for c in clients:
+        await c.aclose()
+    monkeypatch.undo()
+    get_settings.cache_clear()
+    reload(main)
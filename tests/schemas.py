@@ -0,0 +1,24 @@
+"""
+Response schemas used to validate payloads in tests.
+"""
+from pydantic import BaseModel, ConfigDict
+
+
+class RootResponse(BaseModel):
+    """Expected shape of the root endpoint payload."""
+
+    model_config = ConfigDict(strict=True)
+
+    message: str
+    environment: str
+    version: str
+    status: str
+    debug: bool
+
+
+class HealthResponse(BaseModel):
+    """Expected shape of the health endpoint payload."""
+
+    model_config = ConfigDict(strict=True)
+
+    status: str
@@ -1,21 +1,32 @@
 """
 Test suite for FastAPI application.
 """
+import asyncio
+import logging
+
 import pytest
-from fastapi.testclient import TestClient
 from unittest.mock import patch
 
-from app.main import app
+from app import main
+from app.cors import CachedCORSMiddleware
+from app.health_interceptor import HealthCache
+from tests.schemas import HealthResponse, RootResponse
+
 
-client = TestClient(app)
+def _find_middleware(asgi_app, middleware_class):
+    """Walk a built middleware stack and return the first matching layer."""
+    while not isinstance(asgi_app, middleware_class):
+        asgi_app = asgi_app.app
+    return asgi_app
 
 
+@pytest.mark.asyncio
 class TestRootEndpoint:
     """Test cases for the root endpoint."""
     
-    def test_read_root_success(self):
+    async def test_read_root_success(self, client):
         """Test the root endpoint returns correct response."""
-        response = client.get("/")
+        response = await client.get("/")
         assert response.status_code == 200
         
         data = response.json()
@@ -25,87 +36,260 @@ class TestRootEndpoint:
         assert "status" in data
         assert data["status"] == "running"
 
-    def test_root_endpoint_structure(self):
+    async def test_root_endpoint_structure(self, client):
         """Test that root endpoint has expected structure."""
-        response = client.get("/")
+        response = await client.get("/")
         assert response.status_code == 200
         
-        data = response.json()
-        required_fields = ["message", "environment", "version", "status"]
-        
-        for field in required_fields:
-            assert field in data, f"Missing field: {field}"
-        
-        # Check data types
-        assert isinstance(data["message"], str)
-        assert isinstance(data["environment"], str) 
-        assert isinstance(data["version"], str)
-        assert isinstance(data["status"], str)
-
-    @patch.dict("os.environ", {"ENVIRONMENT": "test"}, clear=False)
-    def test_root_endpoint_with_environment(self):
+        # Validates presence and type of every field in one pass
+        RootResponse.model_validate(response.json())
+
+    async def test_root_endpoint_with_environment(self, env_client):
         """Test root endpoint respects environment variable."""
-        # Need to reload modules to pick up environment changes
-        from importlib import reload
-        from app import config, main
-        reload(config)
-        reload(main)
-        
-        test_client = TestClient(main.app)
-        response = test_client.get("/")
+        test_client = await env_client(ENVIRONMENT="test")
+        response = await test_client.get("/")
         
         assert response.status_code == 200
         data = response.json()
         assert data["environment"] == "test"
 
+    async def test_root_schema_documented(self, client):
+        """Test that the OpenAPI schema documents the root payload."""
+        response = await client.get("/openapi.json")
+        assert response.status_code == 200
+
+        schema = response.json()["paths"]["/"]["get"]["responses"]["200"]
+        properties = schema["content"]["application/json"]["schema"]["properties"]
+        assert set(properties) == set(RootResponse.model_fields)
+
+    async def test_openapi_disabled_in_production(self, env_client):
+        """Test that the OpenAPI schema is not served in production."""
+        test_client = await env_client(ENVIRONMENT="production")
+        assert (await test_client.get("/openapi.json")).status_code == 404
+        assert (await test_client.get("/docs")).status_code == 404
+
 
+@pytest.mark.asyncio
 class TestHealthEndpoint:
     """Test cases for the health endpoint."""
     
-    def test_health_check_success(self):
+    async def test_health_check_success(self, client):
         """Test the health endpoint returns healthy status."""
-        response = client.get("/health")
+        response = await client.get("/health")
         assert response.status_code == 200
         
         data = response.json()
         assert data == {"status": "healthy"}
 
-    def test_health_check_response_format(self):
+    async def test_health_check_response_format(self, client):
         """Test health check response format."""
-        response = client.get("/health")
+        response = await client.get("/health")
         assert response.status_code == 200
         
-        data = response.json()
-        assert isinstance(data, dict)
-        assert "status" in data
-        assert isinstance(data["status"], str)
+        HealthResponse.model_validate(response.json())
+
+    @pytest.mark.parametrize("path", ["/healthz", "/readyz"])
+    async def test_health_check_aliases(self, client, path):
+        """Test probe aliases return the same healthy status."""
+        response = await client.get(path)
+        assert response.status_code == 200
+        assert response.json() == {"status": "healthy"}
+
+    async def test_health_check_invalid_method(self, client):
+        """Test that non-GET health requests return 405."""
+        response = await client.post("/health")
+        assert response.status_code == 405
+        assert response.headers["allow"] == "GET"
+
+
+@pytest.mark.asyncio
+class TestHealthCache:
+    """Test cases for the stale-while-revalidate health cache."""
+
+    async def test_failing_check_returns_503(self):
+        """Test that a failing dependency check reports unhealthy."""
+        async def failing_check():
+            raise ConnectionError("database unreachable")
+
+        cache = HealthCache(checks=[failing_check])
+        start, body = await cache.get()
+        assert start["status"] == 503
+        assert body["body"] == b'{"status":"unhealthy"}'
+
+    async def test_stale_status_served_during_refresh(self):
+        """Test that an expired status is served while a refresh runs."""
+        healthy = True
+
+        async def check():
+            if not healthy:
+                raise ConnectionError("database unreachable")
+
+        cache = HealthCache(checks=[check])
+        assert (await cache.get())[0]["status"] == 200
+
+        healthy = False
+        cache.deadline = 0.0
+        assert (await cache.get())[0]["status"] == 200
+
+        await cache._refresh_task
+        assert (await cache.get())[0]["status"] == 503
+
+    async def test_slow_check_times_out(self):
+        """Test that a check exceeding the timeout reports unhealthy."""
+        cache = HealthCache(timeout=0.01)
 
+        @cache.add_check
+        async def slow_check():
+            await asyncio.sleep(1)
 
+        assert (await cache.get())[0]["status"] == 503
+
+    async def test_failing_check_does_not_orphan_others(self):
+        """Test that one failing check does not leave the others running."""
+        finished = []
+
+        async def failing_check():
+            raise ConnectionError("database unreachable")
+
+        async def slower_check():
+            await asyncio.sleep(0.01)
+            finished.append(True)
+
+        cache = HealthCache(checks=[failing_check, slower_check])
+        assert (await cache.get())[0]["status"] == 503
+        assert finished == [True]
+
+
+@pytest.mark.asyncio
 class TestErrorHandling:
     """Test cases for error handling."""
     
-    def test_nonexistent_endpoint(self):
+    async def test_nonexistent_endpoint(self, client):
         """Test that nonexistent endpoints return 404."""
-        response = client.get("/nonexistent")
+        response = await client.get("/nonexistent")
         assert response.status_code == 404
 
-    def test_invalid_method(self):
+    async def test_invalid_method(self, client):
         """Test that invalid HTTP methods return 405."""
-        response = client.post("/")
+        response = await client.post("/")
         assert response.status_code == 405
 
 
+@pytest.mark.asyncio
 class TestCORS:
     """Test cases for CORS configuration."""
     
-    def test_cors_headers_present(self):
+    async def test_cors_headers_present(self, client):
         """Test that CORS headers are present in responses."""
-        response = client.get("/", headers={"Origin": "http://localhost:3000"})
+        response = await client.get("/", headers={"Origin": "http://localhost:3000"})
         assert response.status_code == 200
         
         # Check for CORS headers
         assert "access-control-allow-origin" in response.headers
 
+    async def test_cors_preflight_allows_get_only(self, client):
+        """Test that preflight responses only advertise GET."""
+        response = await client.options(
+            "/",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "GET",
+            },
+        )
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-methods"] == "GET"
+
+    async def test_cors_preflight_memoized(self, client):
+        """Test that preflights are memoized yet reflect each request's headers."""
+        async def preflight(method, requested_headers):
+            return await client.options(
+                "/",
+                headers={
+                    "Origin": "http://localhost:3000",
+                    "Access-Control-Request-Method": method,
+                    "Access-Control-Request-Headers": requested_headers,
+                },
+            )
+
+        first = await preflight("GET", "x-one")
+        cors = _find_middleware(main.fastapi_app.middleware_stack, CachedCORSMiddleware)
+        before = cors._cached_preflight.cache_info()
+
+        repeat = await preflight("GET", "x-one")
+        after_repeat = cors._cached_preflight.cache_info()
+        assert after_repeat.hits == before.hits + 1
+        assert after_repeat.misses == before.misses
+
+        other = await preflight("GET", "x-two")
+        rejected = await preflight("POST", "x-one")
+        assert cors._cached_preflight.cache_info().misses == before.misses + 2
+
+        assert first.headers == repeat.headers
+        assert repeat.headers["access-control-allow-headers"] == "x-one"
+        assert other.headers["access-control-allow-headers"] == "x-two"
+        assert rejected.status_code == 400
+
+    async def test_health_check_bypasses_cors(self, client):
+        """Test that health probes are answered before CORS processing."""
+        response = await client.get(
+            "/health", headers={"Origin": "http://localhost:3000"}
+        )
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+
+
+class TestSettings:
+    """Test cases for application settings."""
+
+    @patch.dict("os.environ", {"LOG_LEVEL": "debug"}, clear=False)
+    def test_log_level_precomputed(self):
+        """Test that the log level is resolved once into int and lowercase forms."""
+        from app.config import Settings
+
+        settings = Settings()
+        assert settings.LOG_LEVEL_INT == logging.DEBUG
+        assert settings.LOG_LEVEL_LOWER == "debug"
+
+    @patch.dict("os.environ", {"LOG_LEVEL": "verbose"}, clear=False)
+    def test_invalid_log_level_falls_back_to_info(self):
+        """Test that an unknown log level falls back to INFO."""
+        from app.config import Settings
+
+        settings = Settings()
+        assert settings.LOG_LEVEL_INT == logging.INFO
+        assert settings.LOG_LEVEL_LOWER == "info"
+
+    @pytest.mark.parametrize(
+        "alias, expected", [("WARN", "warning"), ("FATAL", "critical")]
+    )
+    def test_log_level_alias_normalized(self, alias, expected):
+        """Test that stdlib level aliases resolve to canonical level names."""
+        from app.config import Settings
+
+        with patch.dict("os.environ", {"LOG_LEVEL": alias}, clear=False):
+            assert Settings().LOG_LEVEL_LOWER == expected
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [("1", True), ("True", True), ("yes", True), ("on", True),
+         ("0", False), ("false", False), ("off", False)],
+    )
+    def test_debug_flag_parsing(self, value, expected):
+        """Test that DEBUG accepts common truthy and falsy spellings."""
+        from app.config import Settings
+
+        with patch.dict("os.environ", {"DEBUG": value}, clear=False):
+            assert Settings().DEBUG is expected
+
+    def test_cors_origins_follow_instance_environment(self):
+        """Test that CORS origins are derived from the instance environment."""
+        from app.config import Settings
+
+        with patch.dict("os.environ", {"ENVIRONMENT": "production"}, clear=False):
+            assert Settings().CORS_ORIGINS == []
+        with patch.dict("os.environ", {"ENVIRONMENT": "development"}, clear=False):
+            assert Settings().CORS_ORIGINS == ["*"]
+
 
 @pytest.fixture
 def mock_environment():